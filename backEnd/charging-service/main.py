@@ -1,6 +1,7 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -37,21 +38,28 @@ async def root():
 # WebSocket连接管理器
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        # 并发发送，避免逐个等待；发送失败的连接直接移除
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 manager = ConnectionManager()
 
@@ -71,5 +79,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("CHARGING_SERVICE_PORT", 8081)),
-        reload=os.getenv("NODE_ENV") == "development"
+        reload=os.getenv("NODE_ENV") == "development",
+        # OCPP帧很小，压缩收益有限，关闭permessage-deflate以节省CPU
+        ws_per_message_deflate=False
     )
\ No newline at end of file